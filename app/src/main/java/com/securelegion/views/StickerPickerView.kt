@@ -79,6 +79,9 @@ class StickerPickerView @JvmOverloads constructor(
                 .bufferedReader().use { it.readText() }
             val json = JSONObject(categoriesJson)
 
+            // List the asset dir once instead of opening every file to check it exists
+            val available = (context.assets.list("reactions/noto") ?: emptyArray()).toHashSet()
+
             json.keys().forEach { category ->
                 val items = mutableListOf<StickerItem>()
                 val array = json.getJSONArray(category)
@@ -97,14 +100,11 @@ class StickerPickerView @JvmOverloads constructor(
 
                     // Build the asset filename (matches download script output)
                     val tag = if (tags.isNotEmpty()) tags[0].trim(':').replace('-', '_') else name
-                    val assetPath = "reactions/noto/${codepoint}_${tag}.json"
-
-                    // Verify asset exists before adding
-                    try {
-                        context.assets.open(assetPath).close()
-                        items.add(StickerItem(assetPath, codepoint, name, tags, popularity))
-                    } catch (e: Exception) {
-                        // Asset doesn't exist — skip silently
+                    val filename = "${codepoint}_${tag}.json"
+
+                    // Skip entries whose asset wasn't bundled
+                    if (filename in available) {
+                        items.add(StickerItem("reactions/noto/$filename", codepoint, name, tags, popularity))
                     }
                 }
                 if (items.isNotEmpty()) {